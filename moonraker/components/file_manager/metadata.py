@@ -250,10 +250,7 @@ class BaseSlicer(object):
                 has_miniature = True
         if len(parsed_matches) > 0 and not has_miniature:
             # find the largest thumb index
-            largest_match = parsed_matches[0]
-            for item in parsed_matches:
-                if item['size'] > largest_match['size']:
-                    largest_match = item
+            largest_match = max(parsed_matches, key=lambda x: x['size'])
             # Create miniature thumbnail if one does not exist
             thumb_full_name = largest_match['relative_path'].split("/")[-1]
             thumb_path = os.path.join(thumb_dir, f"{thumb_full_name}")
@@ -973,8 +970,7 @@ def process_objects(file_path: str, slicer: BaseSlicer, name: str) -> bool:
                             "not supported"
                         )
                         return False
-                    for line in processor(in_file):
-                        out_file.write(line)
+                    out_file.writelines(processor(in_file))
                 except Exception as e:
                     logger.info(f"Object processing failed: {e}")
                     return False